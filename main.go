@@ -2,17 +2,25 @@ package main
 
 import (
 	"bytes"
+	"crypto/sha256"
 	"encoding/binary"
+	"encoding/hex"
 	"encoding/json"
 	"fmt"
-	"io/ioutil"
+	"hash/fnv"
+	"io"
+	"math"
 	"os"
 	"os/exec"
 	"path/filepath"
 	"runtime"
+	"sort"
 	"strconv"
 	"strings"
+	"sync"
+	"sync/atomic"
 	"syscall"
+	"time"
 
 	"fyne.io/fyne/v2"
 	"fyne.io/fyne/v2/app"
@@ -40,6 +48,7 @@ type Config struct {
 	FadeDuration     string `json:"fade_duration"`
 	TrimStart        string `json:"trim_start"`
 	TrimEnd          string `json:"trim_end"`
+	ConvertJobs      int    `json:"convert_jobs"`
 	// Tab Visibility
 	ShowExtract      bool   `json:"show_extract"`
 	ShowSequencer    bool   `json:"show_sequencer"`
@@ -50,6 +59,8 @@ type Config struct {
 type ConfigManager struct {
 	ConfigFile string
 	Data       Config
+	mu         sync.Mutex
+	saveTimer  *time.Timer
 }
 
 func NewConfigManager() *ConfigManager {
@@ -82,15 +93,17 @@ func NewConfigManager() *ConfigManager {
 		FadeDuration:     "1.5",
 		TrimStart:        "0",
 		TrimEnd:          "10",
+		ConvertJobs:      defaultConvertJobs(),
 		ShowExtract:      true,
 		ShowSequencer:    true,
 		ShowConvert:      true,
 		ShowPatch:        true,
 	}
 	cm.Load()
+	if cm.Data.ConvertJobs < 1 { cm.Data.ConvertJobs = defaultConvertJobs() }
 	
-	if _, err := os.Stat(autoSound2Wem); err == nil && cm.Data.ToolPath == "" { cm.Data.ToolPath = autoSound2Wem }
-	if _, err := os.Stat(autoVgm); err == nil && cm.Data.DecoderPath == "" { cm.Data.DecoderPath = autoVgm }
+	if cm.Data.ToolPath == "" { if _, err := os.Stat(autoSound2Wem); err == nil { cm.Data.ToolPath = autoSound2Wem } }
+	if cm.Data.DecoderPath == "" { if _, err := os.Stat(autoVgm); err == nil { cm.Data.DecoderPath = autoVgm } }
 	
 	return cm
 }
@@ -100,18 +113,55 @@ func (cm *ConfigManager) Load() {
 	if err == nil { json.Unmarshal(file, &cm.Data) }
 }
 
+// defaultConvertJobs is how many converters run at once unless the user picks another number.
+func defaultConvertJobs() int { return min(8, runtime.NumCPU()) }
+
+// SetConvertJobs records the number of parallel conversions chosen next to the Convert button.
+func (cm *ConfigManager) SetConvertJobs(n int) {
+	if n < 1 { return }
+	cm.mu.Lock(); cm.Data.ConvertJobs = n; cm.mu.Unlock()
+	cm.saveSoon()
+}
+
+// Update applies fn to the config under the lock and saves it straight away, for edits made as one batch.
+func (cm *ConfigManager) Update(fn func(d *Config)) {
+	cm.mu.Lock(); fn(&cm.Data); cm.mu.Unlock()
+	cm.Save()
+}
+
+// configSaveDelay is how long SetPath waits for further changes before writing the config.
+const configSaveDelay = 500 * time.Millisecond
+
+// Save writes the config to a temp file and renames it over the old one, so it is never left half written.
 func (cm *ConfigManager) Save() {
+	cm.mu.Lock(); defer cm.mu.Unlock()
+	if cm.saveTimer != nil { cm.saveTimer.Stop(); cm.saveTimer = nil }
 	data, _ := json.MarshalIndent(cm.Data, "", "    ")
-	os.WriteFile(cm.ConfigFile, data, 0644)
+	tmp := cm.ConfigFile + ".tmp"
+	if os.WriteFile(tmp, data, 0644) == nil { os.Rename(tmp, cm.ConfigFile) }
 }
 
-func (cm *ConfigManager) SetPath(key string, path string) {
+// saveSoon coalesces a burst of changes into one Save, configSaveDelay after the last of them.
+func (cm *ConfigManager) saveSoon() {
+	cm.mu.Lock(); defer cm.mu.Unlock()
+	if cm.saveTimer != nil { cm.saveTimer.Reset(configSaveDelay); return }
+	cm.saveTimer = time.AfterFunc(configSaveDelay, cm.Save)
+}
+
+// Flush writes any change still waiting on saveSoon.
+func (cm *ConfigManager) Flush() {
+	cm.mu.Lock(); pending := cm.saveTimer != nil; cm.mu.Unlock()
+	if pending { cm.Save() }
+}
+
+// SetPath records a path picked in a dialog; isDir says which kind of dialog, so the path never needs a stat.
+// Directory keys given a file keep the file's folder.
+func (cm *ConfigManager) SetPath(key string, path string, isDir bool) {
 	if path == "" { return }
-	info, err := os.Stat(path)
-	isDir := err == nil && info.IsDir()
 	finalPath := path
 	if strings.HasSuffix(key, "_dir") && !isDir { finalPath = filepath.Dir(path) }
 
+	cm.mu.Lock()
 	switch key {
 	case "tool_path": cm.Data.ToolPath = finalPath
 	case "decoder_path": cm.Data.DecoderPath = finalPath
@@ -121,111 +171,970 @@ func (cm *ConfigManager) SetPath(key string, path string) {
 	case "convert_input_dir": cm.Data.ConvertInputDir = finalPath
 	case "convert_output_dir": cm.Data.ConvertOutputDir = finalPath
 	}
-	cm.Save()
+	cm.mu.Unlock()
+	cm.saveSoon()
 }
 
 // ==========================================
 //              CORE LOGIC
 // ==========================================
 
+// logBlockLines is how many lines a lineBuffer holds before passing them on.
+const logBlockLines = 64
+
+// lineBuffer collects one job's log lines and passes them to out in blocks, so parallel workers take the log
+// lock once per block instead of once per line and each job's lines stay together.
+type lineBuffer struct {
+	mu    sync.Mutex
+	buf   strings.Builder
+	lines int
+	out   func(string)
+}
+
+func newLineBuffer(out func(string)) *lineBuffer { return &lineBuffer{out: out} }
+
+// Log queues msg, passing the block on once it is full.
+func (b *lineBuffer) Log(msg string) {
+	b.mu.Lock(); defer b.mu.Unlock()
+	b.buf.WriteString(msg)
+	if b.lines++; b.lines >= logBlockLines { b.flushLocked() }
+}
+
+// Flush passes on whatever is queued.
+func (b *lineBuffer) Flush() { b.mu.Lock(); defer b.mu.Unlock(); b.flushLocked() }
+
+func (b *lineBuffer) flushLocked() {
+	if b.buf.Len() == 0 { return }
+	b.out(b.buf.String())
+	b.buf.Reset(); b.lines = 0
+}
+
+// createNoWindow is CREATE_NO_WINDOW: the child runs without a console window instead of with a hidden one.
+const createNoWindow = 0x08000000
+
+// hiddenProcAttr is shared by every helper process; starting a process only reads it.
+var hiddenProcAttr = &syscall.SysProcAttr{HideWindow: true, CreationFlags: createNoWindow}
+
+// devNull is opened once and handed to every helper process as the streams nobody reads, so a spawn
+// doesn't open and close the null device up to three times; nil if it couldn't be opened.
+var devNull, _ = os.OpenFile(os.DevNull, os.O_RDWR, 0)
+
+// hideConsole keeps a helper process from opening a console window and points its unset standard streams at devNull.
+func hideConsole(cmd *exec.Cmd) {
+	if runtime.GOOS == "windows" { cmd.SysProcAttr = hiddenProcAttr }
+	if devNull == nil { return }
+	if cmd.Stdin == nil { cmd.Stdin = devNull }
+	if cmd.Stdout == nil { cmd.Stdout = devNull }
+	if cmd.Stderr == nil { cmd.Stderr = devNull }
+}
+
 func runCommand(name string, args ...string) error {
 	cmd := exec.Command(name, args...)
-	if runtime.GOOS == "windows" { cmd.SysProcAttr = &syscall.SysProcAttr{HideWindow: true} }
+	hideConsole(cmd)
 	return cmd.Run()
 }
 
+// getDuration reads a WAV's length from its header, asking ffprobe only about files it cannot parse.
 func getDuration(wavPath string) float64 {
+	if f, err := os.Open(wavPath); err == nil {
+		w, err := readWavInfo(f); f.Close()
+		if err == nil && w.ByteRate > 0 { return float64(w.DataSize) / float64(w.ByteRate) }
+	}
 	cmd := exec.Command("ffprobe", "-v", "error", "-show_entries", "format=duration", "-of", "default=noprint_wrappers=1:nokey=1", wavPath)
-	if runtime.GOOS == "windows" { cmd.SysProcAttr = &syscall.SysProcAttr{HideWindow: true} }
-	out, err := cmd.Output()
-	if err != nil { return 0.0 }
-	dur, _ := strconv.ParseFloat(strings.TrimSpace(string(out)), 64)
+	var out bytes.Buffer
+	cmd.Stdout = &out
+	hideConsole(cmd)
+	if err := cmd.Run(); err != nil { return 0.0 }
+	dur, _ := strconv.ParseFloat(strings.TrimSpace(out.String()), 64)
 	return dur
 }
 
+// generateSilence writes duration seconds of 16-bit mono 22050 Hz silence: a header, then the file is extended
+// with Truncate, which fills the rest with zeros without writing them.
 func generateSilence(outputPath string, duration float64) bool {
-	cmd := []string{"-y", "-f", "lavfi", "-i", "anullsrc=r=22050:cl=mono", "-t", fmt.Sprintf("%f", duration), outputPath}
-	return runCommand("ffmpeg", cmd...) == nil
+	w := wavInfo{Format: 1, Channels: 1, SampleRate: 22050, ByteRate: 44100, BlockAlign: 2, Bits: 16}
+	n := int64(math.Round(duration*float64(w.SampleRate))) * int64(w.BlockAlign)
+	f, err := os.Create(outputPath)
+	if err != nil { return false }
+	hdr := wavHeader(w, n)
+	_, err = f.Write(hdr)
+	if err == nil { err = f.Truncate(int64(len(hdr)) + n) }
+	if cerr := f.Close(); err == nil { err = cerr }
+	return err == nil
 }
 
-func runConversion(toolPath, inputWav, outputWem, qualityFlag string) bool {
-	var cmd *exec.Cmd
-	if strings.HasSuffix(strings.ToLower(toolPath), ".cmd") || strings.HasSuffix(strings.ToLower(toolPath), ".bat") {
-		args := []string{"/c", toolPath}
-		if qualityFlag != "" { args = append(args, "--conversion:"+qualityFlag) }
-		args = append(args, inputWav)
-		cmd = exec.Command("cmd.exe", args...)
-	} else {
-		cmd = exec.Command(toolPath, "-encode", inputWav, outputWem)
+// wavInfo is the format and data chunk location read from a RIFF/WAVE header.
+type wavInfo struct {
+	Format, Channels     uint16
+	SampleRate, ByteRate uint32
+	BlockAlign, Bits     uint16
+	DataOffset, DataSize int64
+}
+
+// readWavInfo walks the RIFF chunks of a WAV file until it has both the fmt and data chunks.
+func readWavInfo(f *os.File) (wavInfo, error) {
+	var w wavInfo
+	info, err := f.Stat()
+	if err != nil { return w, err }
+	hdr := make([]byte, 16)
+	if _, err := f.ReadAt(hdr[:12], 0); err != nil || string(hdr[0:4]) != "RIFF" || string(hdr[8:12]) != "WAVE" { return w, fmt.Errorf("%s: not a WAV file", f.Name()) }
+	haveFmt := false
+	for pos := int64(12); pos+8 <= info.Size(); {
+		if _, err := f.ReadAt(hdr[:8], pos); err != nil { break }
+		size := int64(binary.LittleEndian.Uint32(hdr[4:8]))
+		switch string(hdr[0:4]) {
+		case "fmt ":
+			if _, err := f.ReadAt(hdr, pos+8); err != nil { return w, fmt.Errorf("%s: bad fmt chunk", f.Name()) }
+			w.Format, w.Channels = binary.LittleEndian.Uint16(hdr[0:2]), binary.LittleEndian.Uint16(hdr[2:4])
+			w.SampleRate, w.ByteRate = binary.LittleEndian.Uint32(hdr[4:8]), binary.LittleEndian.Uint32(hdr[8:12])
+			w.BlockAlign, w.Bits = binary.LittleEndian.Uint16(hdr[12:14]), binary.LittleEndian.Uint16(hdr[14:16])
+			haveFmt = true
+		case "data":
+			// Streamed WAVs may leave the size unset; the data then runs to the end of the file.
+			w.DataOffset, w.DataSize = pos+8, min(size, info.Size()-pos-8)
+			if !haveFmt || w.BlockAlign == 0 { return w, fmt.Errorf("%s: no fmt chunk before data", f.Name()) }
+			return w, nil
+		}
+		pos += 8 + size + size&1
 	}
-	if runtime.GOOS == "windows" { cmd.SysProcAttr = &syscall.SysProcAttr{HideWindow: true} }
-	err := cmd.Run()
+	return w, fmt.Errorf("%s: no data chunk", f.Name())
+}
 
-	wemName := filepath.Base(outputWem)
-	possibleLocs := []string{
-		outputWem,
-		filepath.Join(filepath.Dir(inputWav), wemName),
-		filepath.Join(filepath.Dir(toolPath), wemName),
-	}
-	for _, loc := range possibleLocs {
-		if _, err := os.Stat(loc); err == nil {
-			if loc != outputWem {
-				os.Remove(outputWem)
-				os.Rename(loc, outputWem)
-			}
-			return true
+// copyBufSize is the chunk size for file copies, where io.Copy would fall back to 32 KiB.
+const copyBufSize = 1 << 20
+
+// fileCopy copies n bytes, or everything if n < 0, from src's current offset to dst through one copyBufSize buffer.
+// Both ends are wrapped so io.CopyBuffer can't hand the copy to ReadFrom/WriteTo, which would ignore the buffer.
+func fileCopy(dst, src *os.File, n int64) error {
+	var r io.Reader = struct{ io.Reader }{src}
+	if n >= 0 { r = io.LimitReader(src, n) }
+	written, err := io.CopyBuffer(struct{ io.Writer }{dst}, r, make([]byte, copyBufSize))
+	if err == nil && n >= 0 && written < n { err = io.ErrUnexpectedEOF }
+	return err
+}
+
+// wavHeader builds a canonical 44-byte header for dataSize bytes of PCM in format w.
+func wavHeader(w wavInfo, dataSize int64) []byte {
+	hdr := make([]byte, 44)
+	le := binary.LittleEndian
+	copy(hdr[0:4], "RIFF"); le.PutUint32(hdr[4:8], uint32(36+dataSize+dataSize&1)); copy(hdr[8:12], "WAVE")
+	copy(hdr[12:16], "fmt "); le.PutUint32(hdr[16:20], 16)
+	le.PutUint16(hdr[20:22], w.Format); le.PutUint16(hdr[22:24], w.Channels); le.PutUint32(hdr[24:28], w.SampleRate)
+	le.PutUint32(hdr[28:32], w.ByteRate); le.PutUint16(hdr[32:34], w.BlockAlign); le.PutUint16(hdr[34:36], w.Bits)
+	copy(hdr[36:40], "data"); le.PutUint32(hdr[40:44], uint32(dataSize))
+	return hdr
+}
+
+// splitRate is the sample rate split clips are cut and encoded at.
+const splitRate = 22050
+
+// readSplitSource returns the header of path if it is 16-bit mono 22050 Hz PCM, the format split clips are cut in.
+func readSplitSource(path string) (wavInfo, error) {
+	f, err := os.Open(path)
+	if err != nil { return wavInfo{}, err }
+	defer f.Close()
+	w, err := readWavInfo(f)
+	if err == nil && (w.Format != 1 || w.Channels != 1 || w.SampleRate != splitRate || w.Bits != 16) { err = fmt.Errorf("%s: not 16-bit mono 22050 Hz PCM", path) }
+	return w, err
+}
+
+// cutWav copies frames sample frames from frame start of the PCM WAV src, whose header is w, into a new WAV at out without decoding.
+func cutWav(src string, w wavInfo, start, frames int64, out string) error {
+	align := int64(w.BlockAlign)
+	off := min(start*align, w.DataSize)
+	n := min(frames*align, w.DataSize-off)
+	f, err := os.Open(src)
+	if err != nil { return err }
+	defer f.Close()
+	if _, err := f.Seek(w.DataOffset+off, io.SeekStart); err != nil { return err }
+	dst, err := os.Create(out)
+	if err != nil { return err }
+	_, err = dst.Write(wavHeader(w, n))
+	if err == nil { err = fileCopy(dst, f, n) }
+	if err == nil && n&1 == 1 { _, err = dst.Write([]byte{0}) }
+	if cerr := dst.Close(); err == nil { err = cerr }
+	if err != nil { os.Remove(out) }
+	return err
+}
+
+// concatWavs joins PCM WAVs of one format into out by copying their data chunks behind a single new header.
+func concatWavs(files []string, out string) error {
+	srcs := make([]*os.File, 0, len(files))
+	defer func() { for _, f := range srcs { f.Close() } }()
+	infos := make([]wavInfo, 0, len(files))
+	total := int64(0)
+	for _, path := range files {
+		f, err := os.Open(path)
+		if err != nil { return err }
+		srcs = append(srcs, f)
+		w, err := readWavInfo(f)
+		if err != nil { return err }
+		if w.Format != 1 && w.Format != 3 { return fmt.Errorf("%s: format %d is not plain PCM", path, w.Format) }
+		if len(infos) > 0 && (w.Format != infos[0].Format || w.Channels != infos[0].Channels || w.SampleRate != infos[0].SampleRate || w.Bits != infos[0].Bits) {
+			return fmt.Errorf("%s: format differs from %s", path, files[0])
+		}
+		infos = append(infos, w); total += w.DataSize
+	}
+	if total+36+total&1 > 0xFFFFFFFF { return fmt.Errorf("merged data is too large for a WAV file") }
+	dst, err := os.Create(out)
+	if err != nil { return err }
+	_, err = dst.Write(wavHeader(infos[0], total))
+	for i := 0; err == nil && i < len(srcs); i++ {
+		if _, err = srcs[i].Seek(infos[i].DataOffset, io.SeekStart); err == nil { err = fileCopy(dst, srcs[i], infos[i].DataSize) }
+	}
+	if err == nil && total&1 == 1 { _, err = dst.Write([]byte{0}) }
+	if cerr := dst.Close(); err == nil { err = cerr }
+	if err != nil { os.Remove(out) }
+	return err
+}
+
+// fadeRamp returns n linear fade-out gains in Q15 fixed point, from just under 1.0 down to 0.
+// A split builds it once and shares it across all of its clips.
+func fadeRamp(n int64) []int32 {
+	r := make([]int32, max(n, 0))
+	for i := range r { r[i] = int32((n - 1 - int64(i)) << 15 / n) }
+	return r
+}
+
+// fadeOutWav applies ramp to the last len(ramp) frames of a 16-bit PCM WAV, rewriting only those samples.
+// A file shorter than the ramp gets its tail, so it still ends in silence.
+func fadeOutWav(path string, ramp []int32) error {
+	f, err := os.OpenFile(path, os.O_RDWR, 0)
+	if err != nil { return err }
+	defer f.Close()
+	w, err := readWavInfo(f)
+	if err != nil { return err }
+	if w.Bits != 16 { return fmt.Errorf("%s: fade needs 16-bit PCM, got %d-bit", path, w.Bits) }
+	frames := w.DataSize / int64(w.BlockAlign)
+	n := min(int64(len(ramp)), frames)
+	if n <= 0 { return nil }
+	tail := make([]byte, n*int64(w.BlockAlign))
+	off := w.DataOffset + (frames-n)*int64(w.BlockAlign)
+	if _, err := f.ReadAt(tail, off); err != nil { return err }
+	for i, gain := range ramp[int64(len(ramp))-n:] {
+		frame := tail[i*int(w.BlockAlign) : (i+1)*int(w.BlockAlign)]
+		for c := 0; c+2 <= len(frame); c += 2 {
+			v := int32(int16(binary.LittleEndian.Uint16(frame[c:])))
+			binary.LittleEndian.PutUint16(frame[c:], uint16(int16(v*gain>>15)))
+		}
+	}
+	_, err = f.WriteAt(tail, off)
+	return err
+}
+
+// scriptLock serializes Sound2wem-style scripts, which stage every run in the same audiotemp folder and list.wsources beside themselves.
+var scriptLock sync.Mutex
+
+// scriptArgBudget keeps a batched script call under cmd.exe's 8191-character command line limit.
+const scriptArgBudget = 7000
+
+// hasSuffixFold reports whether s ends in suffix, ignoring case, without building a lowered copy of s.
+func hasSuffixFold(s, suffix string) bool {
+	return len(s) >= len(suffix) && strings.EqualFold(s[len(s)-len(suffix):], suffix)
+}
+
+// isScript reports whether the converter is a batch script that has to run through cmd.exe.
+func isScript(toolPath string) bool { return hasSuffixFold(toolPath, ".cmd") || hasSuffixFold(toolPath, ".bat") }
+
+// wemName is the file name a converter gives the WEM encoded from wav.
+func wemName(wav string) string {
+	base := filepath.Base(wav)
+	return strings.TrimSuffix(base, filepath.Ext(base)) + ".wem"
+}
+
+// newConverter returns a function that encodes one WAV to outputWem with an encoder taking -encode <in> <out>.
+// Scripts never get here; convertUncached batches them through runScriptBatch.
+func newConverter(toolPath string) func(inputWav, outputWem, qualityFlag string) bool {
+	return func(inputWav, outputWem, qualityFlag string) bool {
+		os.Remove(outputWem)
+		cmd := exec.Command(toolPath, "-encode", inputWav, outputWem)
+		hideConsole(cmd)
+		cmd.Run()
+		_, err := os.Stat(outputWem)
+		return err == nil
+	}
+}
+
+// runScriptBatch converts wavs with a single run of the script, which writes each WEM straight into outDir,
+// and returns the inputs that produced none.
+func runScriptBatch(toolPath string, wavs []string, outDir, qualityFlag string) []string {
+	scriptLock.Lock(); defer scriptLock.Unlock()
+	// The script changes to its own folder, so the output folder has to be absolute.
+	if abs, err := filepath.Abs(outDir); err == nil { outDir = abs }
+	for _, wav := range wavs { os.Remove(filepath.Join(outDir, wemName(wav))) }
+	args := []string{"/c", toolPath, "--out:" + outDir}
+	if qualityFlag != "" { args = append(args, "--conversion:"+qualityFlag) }
+	cmd := exec.Command("cmd.exe", append(args, wavs...)...)
+	hideConsole(cmd)
+	cmd.Run()
+	var failed []string
+	for _, wav := range wavs {
+		if _, err := os.Stat(filepath.Join(outDir, wemName(wav))); err != nil { failed = append(failed, wav) }
+	}
+	return failed
+}
+
+// toolIdentity names a converter by absolute path, modification time and size, so replacing or updating it
+// stops cached WEMs from being served; it returns "" if the tool can't be found.
+func toolIdentity(toolPath string) string {
+	abs, err := filepath.Abs(toolPath)
+	if err != nil { return "" }
+	info, err := os.Stat(abs)
+	if toolPath == "" || err != nil || info.IsDir() { return "" }
+	return fmt.Sprintf("%s\x00%d\x00%d", abs, info.ModTime().UnixNano(), info.Size())
+}
+
+// wemCacheKey identifies the WEM a conversion would produce: the SHA-256 of the WAV's bytes, the converter's identity and the quality.
+func wemCacheKey(wav, toolID, qualityFlag string) string {
+	f, err := os.Open(wav)
+	if err != nil { return "" }
+	defer f.Close()
+	h := sha256.New()
+	io.WriteString(h, toolID+"\x00"+qualityFlag+"\x00")
+	if _, err := io.Copy(h, f); err != nil { return "" }
+	return hex.EncodeToString(h.Sum(nil))
+}
+
+// copyFile copies src to a new file at dst.
+func copyFile(src, dst string) error {
+	in, err := os.Open(src)
+	if err != nil { return err }
+	defer in.Close()
+	out, err := os.Create(dst)
+	if err != nil { return err }
+	err = fileCopy(out, in, -1)
+	if cerr := out.Close(); err == nil { err = cerr }
+	if err != nil { os.Remove(dst) }
+	return err
+}
+
+// convertAll encodes each WAV to a same-named WEM in outDir and returns how many succeeded. WAVs already
+// converted with the same tool and quality are copied from the WEM cache, which is kept under cacheCap;
+// only the rest reach the converter, at most jobs at a time.
+func convertAll(toolPath string, wavs []string, outDir, qualityFlag string, jobs int, logFunc func(string)) int {
+	cacheDir, toolID := appCacheDir("wemcache"), toolIdentity(toolPath)
+	if toolID == "" { cacheDir = "" }
+	keys := make(map[string]string, len(wavs))
+	var todo []string
+	hits := 0
+	for _, wav := range wavs {
+		key := ""
+		if cacheDir != "" { key = wemCacheKey(wav, toolID, qualityFlag) }
+		if key != "" && cacheFetch(filepath.Join(cacheDir, key+".wem"), filepath.Join(outDir, wemName(wav))) { hits++; continue }
+		keys[wav] = key; todo = append(todo, wav)
+	}
+	if hits > 0 { logFunc(fmt.Sprintf("%d WEM(s) reused from cache.\n", hits)) }
+	ok := convertUncached(toolPath, todo, outDir, qualityFlag, jobs, logFunc)
+	if cacheDir != "" && os.MkdirAll(cacheDir, 0755) == nil {
+		for _, wav := range todo {
+			if keys[wav] != "" { cacheStore(cacheDir, keys[wav]+".wem", filepath.Join(outDir, wemName(wav))) }
 		}
+		trimCache(cacheDir, cacheCap)
+	}
+	return hits + ok
+}
+
+// convertUncached runs the converter over wavs. Scripts get as many inputs per run as the command line
+// allows; other converters run up to jobs at once.
+func convertUncached(toolPath string, wavs []string, outDir, qualityFlag string, jobs int, logFunc func(string)) int {
+	if len(wavs) == 0 { return 0 }
+	if isScript(toolPath) {
+		ok := 0
+		for start := 0; start < len(wavs); {
+			end, n := start, 0
+			for end < len(wavs) && (end == start || n+len(wavs[end])+3 <= scriptArgBudget) { n += len(wavs[end]) + 3; end++ }
+			failed := runScriptBatch(toolPath, wavs[start:end], outDir, qualityFlag)
+			for _, wav := range failed { logFunc(fmt.Sprintf("[FAIL] %s\n", filepath.Base(wav))) }
+			ok += end - start - len(failed)
+			start = end
+		}
+		return ok
+	}
+	convert := newConverter(toolPath)
+	workers := max(1, min(jobs, len(wavs)))
+	queue := make(chan string)
+	var ok atomic.Int32
+	var wg sync.WaitGroup
+	for w := 0; w < workers; w++ {
+		wg.Add(1)
+		go func() {
+			defer wg.Done()
+			for wav := range queue {
+				if convert(wav, filepath.Join(outDir, wemName(wav)), qualityFlag) { ok.Add(1); continue }
+				logFunc(fmt.Sprintf("[FAIL] %s\n", filepath.Base(wav)))
+			}
+		}()
 	}
-	return err == nil && false
+	for _, wav := range wavs { queue <- wav }
+	close(queue)
+	wg.Wait()
+	return int(ok.Load())
 }
 
 func runDecoding(decoderPath, inputWem, outputWav string) bool {
 	if decoderPath == "" { return false }
 	cmd := exec.Command(decoderPath, "-o", outputWav, inputWem)
-	if runtime.GOOS == "windows" { cmd.SysProcAttr = &syscall.SysProcAttr{HideWindow: true} }
+	hideConsole(cmd)
 	err := cmd.Run()
 	if _, statErr := os.Stat(outputWav); statErr == nil && err == nil { return true }
 	return false
 }
 
-func IsWwiseBank(path string) bool {
-	f, err := os.Open(path)
-	if err != nil { return false }
-	defer f.Close()
-	buf := make([]byte, 4096)
-	n, err := f.Read(buf)
-	if err != nil { return false }
-	return bytes.Contains(buf[:n], []byte("BKHD"))
+// decodeBatchSize caps how many WEMs one vgmstream process decodes.
+const decodeBatchSize = 256
+
+// decodeBatchFor splits a bank of n WEMs into batches of at most decodeBatchSize, at least one per decode slot,
+// so even a small bank keeps every core busy.
+func decodeBatchFor(n int) int { return max(1, min(decodeBatchSize, (n+cap(decodeSlots)-1)/cap(decodeSlots))) }
+
+// runDecodingBatch decodes the WEMs named by fids in wemDir into wavDir with a single vgmstream process and returns the IDs
+// that produced no WAV. Inputs are passed as bare names so the command line stays short; vgmstream writes <name>.wem.wav,
+// which is renamed to <id>.wav.
+func runDecodingBatch(decoderPath, wemDir, wavDir string, fids []string) []string {
+	if abs, err := filepath.Abs(wavDir); err == nil { wavDir = abs }
+	args := make([]string, 0, len(fids)+2)
+	args = append(args, "-o", filepath.Join(wavDir, "?f.wav"))
+	for _, fid := range fids { args = append(args, fid+".wem") }
+	cmd := exec.Command(decoderPath, args...)
+	cmd.Dir = wemDir
+	hideConsole(cmd)
+	// The exit status only says whether every file worked; the outputs tell which ones did.
+	cmd.Run()
+	var failed []string
+	for _, fid := range fids {
+		if os.Rename(filepath.Join(wavDir, fid+".wem.wav"), filepath.Join(wavDir, fid+".wav")) != nil { failed = append(failed, fid) }
+	}
+	return failed
 }
 
-func parseBnk(bnkPath string, logFunc func(string)) ([]byte, int64, uint32, int64) {
-	data, err := os.ReadFile(bnkPath)
+// Chunk IDs searched for as raw bytes in the header block, so the scan never builds strings.
+var (
+	magicBKHD = []byte("BKHD")
+	magicDIDX = []byte("DIDX")
+)
+
+// Chunk IDs as little-endian words, so the chunk walk compares each header with one integer compare.
+const (
+	idDIDX = 0x58444944
+	idDATA = 0x41544144
+)
+
+// didxEntrySize is the width of one DIDX record: file ID, offset into DATA, size.
+const didxEntrySize = 12
+
+// readDidx decodes the DIDX record at pos with a single bounds check.
+func readDidx(b []byte, pos int) (uint32, uint32, uint32) {
+	r := b[pos : pos+didxEntrySize : pos+didxEntrySize]
+	return binary.LittleEndian.Uint32(r[0:4]), binary.LittleEndian.Uint32(r[4:8]), binary.LittleEndian.Uint32(r[8:12])
+}
+
+// didxEntry is one decoded DIDX record.
+type didxEntry struct {
+	ID     uint32
+	Offset uint32
+	Size   uint32
+}
+
+// decodeDidx decodes the whole DIDX table in one pass into a preallocated slice.
+func decodeDidx(table []byte) []didxEntry {
+	entries := make([]didxEntry, len(table)/didxEntrySize)
+	for i := range entries {
+		entries[i].ID, entries[i].Offset, entries[i].Size = readDidx(table, i*didxEntrySize)
+	}
+	return entries
+}
+
+// openBnk parses and indexes a bank without loading it, returning the decoded DIDX table with the
+// DIDX and DATA payload offsets; WEM payloads are read on demand with ReadAt.
+func openBnk(bnkPath string, logFunc func(string)) (*os.File, []didxEntry, int64, int64) {
+	name := filepath.Base(bnkPath)
+	f, err := os.Open(bnkPath)
+	if err != nil {
+		logFunc(fmt.Sprintf("Error reading file: %v\n", err))
+		return nil, nil, 0, 0
+	}
+	info, err := f.Stat()
 	if err != nil {
+		f.Close()
 		logFunc(fmt.Sprintf("Error reading file: %v\n", err))
-		return nil, 0, 0, 0
+		return nil, nil, 0, 0
+	}
+	if h, table := loadBnkIndex(bnkPath, info); table != nil { return f, decodeDidx(table), h.DidxOffset, h.DataOffset }
+	head, didxOffset, didxSize, dataOffset := scanChunks(f, info.Size(), name, logFunc)
+	if didxOffset == -1 { f.Close(); return nil, nil, 0, 0 }
+	// The table usually sits inside the header block scanChunks already read.
+	var table []byte
+	if end := didxOffset + int64(didxSize); end <= int64(len(head)) {
+		table = head[didxOffset:end]
+	} else {
+		table = make([]byte, didxSize)
+		if _, err := f.ReadAt(table, didxOffset); err != nil {
+			f.Close()
+			logFunc(fmt.Sprintf("[ERROR] %s: DIDX unreadable: %v\n", name, err))
+			return nil, nil, 0, 0
+		}
+	}
+	saveBnkIndex(bnkPath, bnkIndexHeader{ModTime: info.ModTime().UnixNano(), Size: info.Size(), DidxOffset: didxOffset, DataOffset: dataOffset, DidxSize: didxSize}, table)
+	return f, decodeDidx(table), didxOffset, dataOffset
+}
+
+// bnkIndexHeader prefixes a cached copy of a bank's DIDX table; ModTime and Size tie it to one version of the bank.
+type bnkIndexHeader struct {
+	ModTime    int64
+	Size       int64
+	DidxOffset int64
+	DataOffset int64
+	DidxSize   uint32
+}
+
+// bnkIndexPath names the sidecar for a bank in the user cache directory, keyed by the bank's absolute path.
+func bnkIndexPath(bnkPath string) string {
+	dir := appCacheDir("bnkindex")
+	if dir == "" { return "" }
+	abs, _ := filepath.Abs(bnkPath)
+	h := fnv.New64a(); h.Write([]byte(abs))
+	return filepath.Join(dir, fmt.Sprintf("%016x.idx", h.Sum64()))
+}
+
+// appCacheDir names a folder for the editor's caches in the user cache directory, or "" if there is none.
+func appCacheDir(sub string) string {
+	cacheDir, err := os.UserCacheDir()
+	if err != nil { return "" }
+	return filepath.Join(cacheDir, "EchoAudioEditor", sub)
+}
+
+// cacheCap bounds each content cache on disk; the least recently used entries are deleted first.
+const cacheCap = 1 << 30
+
+// cacheFetch copies the cached entry at path to dst and marks it as recently used.
+func cacheFetch(path, dst string) bool {
+	if copyFile(path, dst) != nil { return false }
+	now := time.Now(); os.Chtimes(path, now, now)
+	return true
+}
+
+// cacheStore copies src into dir as name through its own temp file from os.CreateTemp, so concurrent stores
+// of the same entry never share a staging file; failures only mean the work is redone next time.
+func cacheStore(dir, name, src string) {
+	in, err := os.Open(src)
+	if err != nil { return }
+	defer in.Close()
+	tmp, err := os.CreateTemp(dir, name+".*.tmp")
+	if err != nil { return }
+	err = fileCopy(tmp, in, -1)
+	if cerr := tmp.Close(); err == nil { err = cerr }
+	if err == nil { err = os.Rename(tmp.Name(), filepath.Join(dir, name)) }
+	if err != nil { os.Remove(tmp.Name()) }
+}
+
+// trimCache deletes the least recently used entries in dir, oldest modification time first, until it holds at most limit bytes.
+func trimCache(dir string, limit int64) {
+	if dir == "" { return }
+	entries, err := os.ReadDir(dir)
+	if err != nil { return }
+	type cached struct { path string; size int64; used time.Time }
+	var items []cached; total := int64(0)
+	for _, e := range entries {
+		if e.IsDir() || strings.HasSuffix(e.Name(), ".tmp") { continue }
+		info, err := e.Info()
+		if err != nil { continue }
+		items = append(items, cached{filepath.Join(dir, e.Name()), info.Size(), info.ModTime()}); total += info.Size()
 	}
-	startIndex := bytes.Index(data, []byte("BKHD"))
+	if total <= limit { return }
+	sort.Slice(items, func(a, b int) bool { return items[a].used.Before(items[b].used) })
+	for _, it := range items {
+		if total <= limit { break }
+		if os.Remove(it.path) == nil { total -= it.size }
+	}
+}
+
+// bnkIndexHeaderSize is the encoded width of bnkIndexHeader: four int64 fields and the uint32 table size.
+const bnkIndexHeaderSize = 4*8 + 4
+
+// loadBnkIndex returns the cached header and DIDX table, or nil if there is none for this version of the bank.
+// The sidecar is read with one ReadFull into a buffer sized from its stat and decoded in place.
+func loadBnkIndex(bnkPath string, info os.FileInfo) (bnkIndexHeader, []byte) {
+	var h bnkIndexHeader
+	path := bnkIndexPath(bnkPath)
+	if path == "" { return h, nil }
+	f, err := os.Open(path)
+	if err != nil { return h, nil }
+	defer f.Close()
+	st, err := f.Stat()
+	if err != nil || st.Size() < bnkIndexHeaderSize { return h, nil }
+	data := make([]byte, st.Size())
+	if _, err := io.ReadFull(f, data); err != nil { return h, nil }
+	le := binary.LittleEndian
+	h.ModTime, h.Size = int64(le.Uint64(data[0:8])), int64(le.Uint64(data[8:16]))
+	h.DidxOffset, h.DataOffset = int64(le.Uint64(data[16:24])), int64(le.Uint64(data[24:32]))
+	h.DidxSize = le.Uint32(data[32:36])
+	table := data[bnkIndexHeaderSize:]
+	if h.ModTime != info.ModTime().UnixNano() || h.Size != info.Size() || uint32(len(table)) != h.DidxSize { return h, nil }
+	return h, table
+}
+
+// saveBnkIndex writes the sidecar; failures only mean the next open scans the bank again.
+func saveBnkIndex(bnkPath string, h bnkIndexHeader, table []byte) {
+	path := bnkIndexPath(bnkPath)
+	if path == "" { return }
+	buf := make([]byte, bnkIndexHeaderSize+len(table))
+	le := binary.LittleEndian
+	le.PutUint64(buf[0:8], uint64(h.ModTime)); le.PutUint64(buf[8:16], uint64(h.Size))
+	le.PutUint64(buf[16:24], uint64(h.DidxOffset)); le.PutUint64(buf[24:32], uint64(h.DataOffset))
+	le.PutUint32(buf[32:36], h.DidxSize)
+	copy(buf[bnkIndexHeaderSize:], table)
+	os.MkdirAll(filepath.Dir(path), 0755)
+	os.WriteFile(path, buf, 0644)
+}
+
+// scanChunks walks the chunk headers from BKHD onwards, touching only the 8-byte headers.
+// It also returns the leading header block it read so callers can reuse it.
+func scanChunks(r io.ReaderAt, size int64, name string, logFunc func(string)) ([]byte, int64, uint32, int64) {
+	head := make([]byte, 4096)
+	n, _ := r.ReadAt(head, 0)
+	head = head[:n]
+	startIndex := bytes.Index(head, magicBKHD)
 	if startIndex == -1 {
-		logFunc(fmt.Sprintf("[WARN] %s: No 'BKHD' header found.\n", filepath.Base(bnkPath)))
-		return nil, 0, 0, 0
+		logFunc(fmt.Sprintf("[WARN] %s: No 'BKHD' header found.\n", name))
+		return head, -1, 0, -1
+	}
+	hdr := make([]byte, 8)
+	// Fast path: banks lay out DIDX right after BKHD with DATA directly behind it, so find DIDX
+	// by search and accept it only if it is 4-byte aligned to BKHD, as chunk boundaries are, and
+	// a DATA header sits where its size says; otherwise walk.
+	if i := bytes.Index(head[startIndex:n], magicDIDX); i != -1 && i%4 == 0 && startIndex+i+8 <= n {
+		didxPos := startIndex + i
+		didxSize := binary.LittleEndian.Uint32(head[didxPos+4 : didxPos+8])
+		dataPos := int64(didxPos) + 8 + int64(didxSize)
+		if didxSize%didxEntrySize == 0 && dataPos+8 <= size {
+			if _, err := r.ReadAt(hdr, dataPos); err == nil && binary.LittleEndian.Uint32(hdr[0:4]) == idDATA {
+				return head, int64(didxPos) + 8, didxSize, dataPos + 8
+			}
+		}
 	}
-	offset := startIndex
+	offset := int64(startIndex)
 	didxOffset := int64(-1); didxSize := uint32(0); dataOffset := int64(-1)
-	for offset < len(data)-8 {
-		chunkID := string(data[offset : offset+4])
-		chunkSize := binary.LittleEndian.Uint32(data[offset+4 : offset+8])
-		if chunkID == "DIDX" {
-			didxOffset = int64(offset + 8); didxSize = chunkSize
-		} else if chunkID == "DATA" {
-			dataOffset = int64(offset + 8)
+	// Headers inside the block already read come from it; only chunks past it cost a ReadAt.
+	for offset < size-8 {
+		if offset+8 <= int64(n) {
+			copy(hdr, head[offset:offset+8])
+		} else if _, err := r.ReadAt(hdr, offset); err != nil { break }
+		id, chunkSize := binary.LittleEndian.Uint32(hdr[0:4]), binary.LittleEndian.Uint32(hdr[4:8])
+		if id == idDIDX {
+			didxOffset = offset + 8; didxSize = chunkSize
+		} else if id == idDATA {
+			dataOffset = offset + 8
 		}
-		offset += 8 + int(chunkSize)
+		offset += 8 + int64(chunkSize)
 	}
 	if didxOffset == -1 || dataOffset == -1 {
-		logFunc(fmt.Sprintf("Error: %s invalid (Missing DIDX/DATA).\n", filepath.Base(bnkPath)))
-		return nil, 0, 0, 0
+		logFunc(fmt.Sprintf("Error: %s invalid (Missing DIDX/DATA).\n", name))
+		return head, -1, 0, -1
+	}
+	return head, didxOffset, didxSize, dataOffset
+}
+
+// wavCacheKey names the decoded WAV for a WEM payload: a SHA-256 of the decoder's toolIdentity and the payload bytes,
+// so the same sound is only decoded once whichever bank it comes from, and a replaced decoder starts afresh.
+func wavCacheKey(decoderID string, payload []byte) string {
+	h := sha256.New()
+	io.WriteString(h, decoderID+"\x00")
+	h.Write(payload)
+	return hex.EncodeToString(h.Sum(nil))
+}
+
+// storeWav copies a freshly decoded WAV into the WAV cache; failures only mean it is decoded again next time.
+func storeWav(cacheDir, key, wavPath string) {
+	if cacheDir == "" || key == "" { return }
+	cacheStore(cacheDir, key+".wav", wavPath)
+}
+
+// decodeSlots caps the number of vgmstream processes running at once across all banks being extracted.
+var decodeSlots = make(chan struct{}, runtime.NumCPU())
+
+// extractBank dumps every WEM in the bank to wemDir and decodes each one into wavDir.
+// Payloads are written in order; vgmstream decodes them in batches sized by decodeBatchFor, each started as soon as
+// its WEMs are on disk and a slot is free. Other decoders get one process per file.
+func extractBank(bnkPath, wemDir, wavDir, decoderPath string, logFunc func(string)) bool {
+	name := filepath.Base(bnkPath)
+	bnk, entries, _, payload := openBnk(bnkPath, logFunc)
+	if bnk == nil { return false }
+	defer bnk.Close()
+	for _, dir := range []string{wemDir, wavDir} {
+		if err := os.MkdirAll(dir, 0755); err != nil { logFunc(fmt.Sprintf("[ERROR] %s: %v\n", name, err)); return false }
+	}
+	// Payloads are served from a read window so a run of small WEMs costs one ReadAt, not one each.
+	var window, win []byte; winStart := int64(0)
+	wemPrefix := wemDir + string(os.PathSeparator); wavPrefix := wavDir + string(os.PathSeparator)
+	var decodes sync.WaitGroup
+	defer decodes.Wait()
+	batched := strings.Contains(strings.ToLower(filepath.Base(decoderPath)), "vgmstream")
+	batchSize := decodeBatchFor(len(entries))
+	cacheDir := ""
+	decoderID := toolIdentity(decoderPath)
+	if decoderID != "" { if dir := appCacheDir("wavcache"); dir != "" && os.MkdirAll(dir, 0755) == nil { cacheDir = dir } }
+	hits := 0
+	defer func() { if hits > 0 { logFunc(fmt.Sprintf("%s: %d WAV(s) reused from cache.\n", name, hits)) } }()
+	var batch, batchKeys []string
+	flush := func() {
+		if len(batch) == 0 { return }
+		fids, keys := batch, batchKeys; batch, batchKeys = nil, nil
+		decodeSlots <- struct{}{}
+		decodes.Add(1)
+		go func() {
+			defer func() { <-decodeSlots; decodes.Done() }()
+			failed := map[string]bool{}
+			for _, fid := range runDecodingBatch(decoderPath, wemDir, wavDir, fids) { failed[fid] = true; logFunc(fmt.Sprintf("[WARN] %s: %s failed to decode\n", name, fid)) }
+			for i, fid := range fids { if !failed[fid] { storeWav(cacheDir, keys[i], wavPrefix+fid+".wav") } }
+		}()
+	}
+	// Walk payloads in file order so reads stay sequential and each window serves a whole run of WEMs.
+	if !sort.SliceIsSorted(entries, func(i, j int) bool { return entries[i].Offset < entries[j].Offset }) {
+		sort.Slice(entries, func(i, j int) bool { return entries[i].Offset < entries[j].Offset })
+	}
+	for _, e := range entries {
+		fid := strconv.FormatUint(uint64(e.ID), 10)
+		wemPath := wemPrefix + fid + ".wem"
+		start := payload + int64(e.Offset); end := start + int64(e.Size)
+		if start < winStart || end > winStart+int64(len(win)) {
+			if window == nil || int(e.Size) > cap(window) { window = make([]byte, max(1<<20, int(e.Size))) }
+			m, _ := bnk.ReadAt(window[:cap(window)], start)
+			win, winStart = window[:m], start
+		}
+		if end > winStart+int64(len(win)) { logFunc(fmt.Sprintf("[WARN] %s: %d truncated\n", name, e.ID)); continue }
+		data := win[start-winStart : end-winStart]
+		if err := os.WriteFile(wemPath, data, 0644); err != nil { logFunc(fmt.Sprintf("[WARN] %s: %d not written: %v\n", name, e.ID, err)); continue }
+		if decoderPath == "" { continue }
+		key := ""
+		if cacheDir != "" { key = wavCacheKey(decoderID, data) }
+		if key != "" && cacheFetch(filepath.Join(cacheDir, key+".wav"), wavPrefix+fid+".wav") { hits++; continue }
+		if batched {
+			batchKeys = append(batchKeys, key)
+			if batch = append(batch, fid); len(batch) == batchSize { flush() }
+			continue
+		}
+		decodeSlots <- struct{}{}
+		decodes.Add(1)
+		go func(id uint32, wemPath, wavPath, key string) {
+			defer func() { <-decodeSlots; decodes.Done() }()
+			if !runDecoding(decoderPath, wemPath, wavPath) { logFunc(fmt.Sprintf("[WARN] %s: %d failed to decode\n", name, id)); return }
+			storeWav(cacheDir, key, wavPath)
+		}(e.ID, wemPath, wavPrefix + fid + ".wav", key)
+	}
+	flush()
+	return true
+}
+
+// wemFile is a replacement WEM with its size taken from the directory listing.
+type wemFile struct {
+	Path string
+	Size int64
+}
+
+// scanWems indexes the numerically named .wem files in dir by file ID, keeping the listing's size so no per-file stat is needed.
+func scanWems(dir string) map[uint32]wemFile {
+	avail := make(map[uint32]wemFile)
+	entries, _ := os.ReadDir(dir)
+	for _, e := range entries {
+		name := e.Name()
+		if e.IsDir() || !hasSuffixFold(name, ".wem") { continue }
+		fid, err := strconv.ParseUint(name[:len(name)-len(".wem")], 10, 32)
+		if err != nil { continue }
+		info, err := e.Info()
+		if err != nil { continue }
+		avail[uint32(fid)] = wemFile{Path: filepath.Join(dir, name), Size: info.Size()}
+	}
+	return avail
+}
+
+// readFileInto fills buf from the start of the file at path.
+func readFileInto(path string, buf []byte) error {
+	f, err := os.Open(path)
+	if err != nil { return err }
+	defer f.Close()
+	_, err = io.ReadFull(f, buf)
+	return err
+}
+
+// zeroBlock is the shared source for slot padding so clearing never allocates.
+var zeroBlock [64 << 10]byte
+
+// writeZeros clears n bytes at off in blocks of zeroBlock, stopping at the first failed write.
+func writeZeros(w io.WriterAt, off, n int64) error {
+	for n > 0 {
+		chunk := int64(len(zeroBlock))
+		if n < chunk { chunk = n }
+		if _, err := w.WriteAt(zeroBlock[:chunk], off); err != nil { return err }
+		off += chunk; n -= chunk
+	}
+	return nil
+}
+
+// patchTarget is a bank being rebuilt: its source, the staged copy and the DIDX slot of each file ID.
+type patchTarget struct {
+	name, outPath, tmpPath string
+	src, dst               *os.File
+	didx, payload          int64
+	slots                  map[uint32]int
+	entries                []didxEntry
+	err                    error
+}
+
+// openPatchTarget indexes the bank; nothing is copied until stage.
+func openPatchTarget(bnkPath, outPath string, logFunc func(string)) *patchTarget {
+	src, entries, didx, payload := openBnk(bnkPath, logFunc)
+	if src == nil { return nil }
+	t := &patchTarget{name: filepath.Base(bnkPath), outPath: outPath, tmpPath: outPath + ".tmp", src: src, didx: didx, payload: payload, entries: entries}
+	t.slots = make(map[uint32]int, len(t.entries))
+	for i, e := range t.entries { t.slots[e.ID] = i }
+	return t
+}
+
+// matches reports whether any of the replacement IDs has a slot in the bank.
+func (t *patchTarget) matches(avail map[uint32]wemFile) bool {
+	for fid := range avail { if _, ok := t.slots[fid]; ok { return true } }
+	return false
+}
+
+// stage copies the bank next to outPath, so the source can be the target itself.
+func (t *patchTarget) stage(logFunc func(string)) bool {
+	dst, err := os.Create(t.tmpPath)
+	if err != nil { t.src.Close(); logFunc(fmt.Sprintf("[ERROR] %v\n", err)); return false }
+	// Size the copy up front so the filesystem allocates it in one extent instead of growing it per write.
+	if info, err := t.src.Stat(); err == nil { dst.Truncate(info.Size()) }
+	// io.Copy would move the bank in 32 KiB chunks, so stage it in 4 MiB writes.
+	_, err = io.CopyBuffer(struct{ io.Writer }{dst}, struct{ io.Reader }{t.src}, make([]byte, 4<<20))
+	if err != nil { t.src.Close(); dst.Close(); os.Remove(t.tmpPath); logFunc(fmt.Sprintf("[ERROR] Copying %s: %v\n", t.name, err)); return false }
+	t.dst = dst
+	return true
+}
+
+// WriteAt writes to the staged copy and keeps the first error, so a bank with a failed write is never saved.
+func (t *patchTarget) WriteAt(b []byte, off int64) (int, error) {
+	if t.err != nil { return 0, t.err }
+	n, err := t.dst.WriteAt(b, off)
+	if err != nil { t.err = err }
+	return n, err
+}
+
+// inject writes nb into slot i, zero-pads the rest of the slot and updates its DIDX size.
+func (t *patchTarget) inject(i int, nb []byte) error {
+	t.WriteAt(nb, t.payload+int64(t.entries[i].Offset))
+	return t.pad(i, int64(len(nb)))
+}
+
+// injectFile streams n bytes of the file at path into slot i through buf, for replacements too big to hold in memory.
+// If the file can't be read in full, the slot's original bytes are put back; a failed write is left in t.err.
+func (t *patchTarget) injectFile(i int, path string, n int64, buf []byte) error {
+	f, err := os.Open(path)
+	if err != nil { return err }
+	defer f.Close()
+	off := t.payload + int64(t.entries[i].Offset)
+	copied, err := io.CopyBuffer(struct{ io.Writer }{io.NewOffsetWriter(t, off)}, io.LimitReader(f, n), buf)
+	if err == nil && copied != n { err = io.ErrUnexpectedEOF }
+	if err != nil {
+		if t.err == nil { io.CopyBuffer(struct{ io.Writer }{io.NewOffsetWriter(t, off)}, io.NewSectionReader(t.src, off, int64(t.entries[i].Size)), buf) }
+		return err
+	}
+	return t.pad(i, n)
+}
+
+// pad zero-fills slot i past its first n bytes and records n as the slot's DIDX size.
+func (t *patchTarget) pad(i int, n int64) error {
+	e := t.entries[i]
+	writeZeros(t, t.payload+int64(e.Offset)+n, int64(e.Size)-n)
+	var sizeField [4]byte
+	binary.LittleEndian.PutUint32(sizeField[:], uint32(n))
+	t.WriteAt(sizeField[:], t.didx+int64(i*didxEntrySize)+8)
+	return t.err
+}
+
+// finish closes the bank and moves the staged copy over the output.
+func (t *patchTarget) finish() error {
+	err := t.dst.Close()
+	t.src.Close()
+	if err == nil { err = os.Rename(t.tmpPath, t.outPath) }
+	if err != nil { os.Remove(t.tmpPath) }
+	return err
+}
+
+// eachBank runs fn for every index below n on up to NumCPU goroutines and waits for them.
+func eachBank(n int, fn func(i int)) {
+	var wg sync.WaitGroup
+	slots := make(chan struct{}, runtime.NumCPU())
+	for i := 0; i < n; i++ {
+		wg.Add(1); slots <- struct{}{}
+		go func(i int) { defer func() { <-slots; wg.Done() }(); fn(i) }(i)
+	}
+	wg.Wait()
+}
+
+// patchBanks rebuilds each bank into outDir from one scan of the WEM folder; every
+// replacement is read once and written into all banks that carry its file ID.
+// Banks are staged and saved in parallel, as those whole-bank copies are most of the work;
+// banks with no matching file ID are never copied.
+func patchBanks(bnkPaths []string, outDir string, avail map[uint32]wemFile, logFunc func(string)) int {
+	opened := make([]*patchTarget, len(bnkPaths))
+	unmatched := make([]bool, len(bnkPaths))
+	eachBank(len(bnkPaths), func(i int) {
+		t := openPatchTarget(bnkPaths[i], filepath.Join(outDir, filepath.Base(bnkPaths[i])), logFunc)
+		if t == nil { return }
+		if !t.matches(avail) { t.src.Close(); unmatched[i] = true; return }
+		if t.stage(logFunc) { opened[i] = t }
+	})
+	var targets []*patchTarget
+	for i, t := range opened {
+		if unmatched[i] { logFunc(fmt.Sprintf("[SKIP] %s: no matching WEMs\n", filepath.Base(bnkPaths[i]))) }
+		if t != nil { targets = append(targets, t) }
+	}
+	ids := make([]uint32, 0, len(avail))
+	for fid := range avail { ids = append(ids, fid) }
+	sort.Slice(ids, func(a, b int) bool { return ids[a] < ids[b] })
+
+	patched := make([]int, len(targets))
+	// Replacements up to the buffer size are read once and written to every bank; bigger ones are streamed
+	// through it per bank, so memory stays at one buffer however large the WEMs are.
+	buf := make([]byte, 1<<20)
+	for _, fid := range ids {
+		wem := avail[fid]
+		loaded := false
+		for ti, t := range targets {
+			i, ok := t.slots[fid]
+			if !ok || t.err != nil { continue }
+			if wem.Size > int64(t.entries[i].Size) { logFunc(fmt.Sprintf("[FAIL] %s: %d too big (%d bytes, slot holds %d)\n", t.name, fid, wem.Size, t.entries[i].Size)); continue }
+			if wem.Size > int64(len(buf)) {
+				if err := t.injectFile(i, wem.Path, wem.Size, buf); err != nil {
+					if t.err != nil { logFunc(fmt.Sprintf("[ERROR] Writing %s: %v\n", t.name, t.err)); continue }
+					logFunc(fmt.Sprintf("[FAIL] %d unreadable\n", fid)); break
+				}
+			} else {
+				if !loaded {
+					if err := readFileInto(wem.Path, buf[:wem.Size]); err != nil { logFunc(fmt.Sprintf("[FAIL] %d unreadable\n", fid)); break }
+					loaded = true
+				}
+				if err := t.inject(i, buf[:wem.Size]); err != nil { logFunc(fmt.Sprintf("[ERROR] Writing %s: %v\n", t.name, err)); continue }
+			}
+			patched[ti]++
+			logFunc(fmt.Sprintf("[OK] %s: %d\n", t.name, fid))
+		}
 	}
-	return data, didxOffset, didxSize, dataOffset
+
+	errs := make([]error, len(targets))
+	eachBank(len(targets), func(ti int) {
+		t := targets[ti]
+		if patched[ti] == 0 || t.err != nil { t.dst.Close(); t.src.Close(); os.Remove(t.tmpPath); return }
+		errs[ti] = t.finish()
+	})
+	saved := 0
+	for ti, t := range targets {
+		// A failed write was logged when it happened; the bank is simply not saved.
+		if t.err != nil { continue }
+		if patched[ti] == 0 { logFunc(fmt.Sprintf("[SKIP] %s: nothing replaced\n", t.name)); continue }
+		if errs[ti] != nil { logFunc(fmt.Sprintf("[ERROR] Saving %s: %v\n", t.name, errs[ti])); continue }
+		logFunc(fmt.Sprintf("Saved %s (%d replaced).\n", t.name, patched[ti]))
+		saved++
+	}
+	return saved
 }
 
 // ==========================================
@@ -253,22 +1162,34 @@ func main() {
 	logEntry.Wrapping = fyne.TextWrapWord
 	logEntry.Disable()
 	logEntry.Bind(logData) 
+	// Workers only append to logText; the widget is refreshed at most every 50ms with whatever piled up.
+	var logMu sync.Mutex
+	var logText strings.Builder
+	logText.WriteString("System Log Initialized...\n")
+	logDirty := false
+	// The log view only keeps the most recent output; once it passes maxLogBytes it drops back to the newest half,
+	// so each redraw stays bounded however long the session runs.
+	const maxLogBytes = 256 << 10
 	logFunc := func(msg string) {
 		fmt.Print(msg)
-		current, _ := logData.Get()
-		logData.Set(current + msg)
+		logMu.Lock()
+		logText.WriteString(msg); logDirty = true
+		if logText.Len() > maxLogBytes {
+			tail := logText.String()[logText.Len()-maxLogBytes/2:]
+			if i := strings.IndexByte(tail, '\n'); i != -1 { tail = tail[i+1:] }
+			logText.Reset(); logText.WriteString(tail)
+		}
+		logMu.Unlock()
 	}
-	
-	// UI Update Trigger
-	uiTrigger := binding.NewBool()
-	var uiAction func()
-	uiTrigger.AddListener(binding.NewDataListener(func() {
-		if val, _ := uiTrigger.Get(); val {
-			if uiAction != nil { uiAction() }
-			uiTrigger.Set(false)
+	go func() {
+		for range time.Tick(50 * time.Millisecond) {
+			logMu.Lock()
+			if !logDirty { logMu.Unlock(); continue }
+			text := logText.String(); logDirty = false
+			logMu.Unlock()
+			fyne.Do(func() { logData.Set(text) })
 		}
-	}))
-	runOnUI := func(f func()) { uiAction = f; uiTrigger.Set(true) }
+	}()
 
 	showHelp := func(title, content string) { dialog.ShowInformation(title, content, myWindow) }
 
@@ -276,11 +1197,11 @@ func main() {
 		btn := widget.NewButtonWithIcon("", theme.FolderOpenIcon(), func() {
 			if isDir {
 				dialog.ShowFolderOpen(func(uri fyne.ListableURI, err error) {
-					if uri != nil { entry.SetText(uri.Path()); cfg.SetPath(key, uri.Path()) }
+					if uri != nil { entry.SetText(uri.Path()); cfg.SetPath(key, uri.Path(), true) }
 				}, myWindow)
 			} else {
 				fd := dialog.NewFileOpen(func(r fyne.URIReadCloser, err error) {
-					if r != nil { entry.SetText(r.URI().Path()); cfg.SetPath(key, r.URI().Path()) }
+					if r != nil { entry.SetText(r.URI().Path()); cfg.SetPath(key, r.URI().Path(), false) }
 				}, myWindow)
 				if len(filterExts) > 0 { fd.SetFilter(storageFilter(filterExts)) }
 				fd.Show()
@@ -296,49 +1217,67 @@ func main() {
 	bnkScroll := container.NewScroll(bnkCheckGroup)
 	bnkScroll.SetMinSize(fyne.NewSize(0, 300))
 	patchBnkSelect := widget.NewSelect([]string{}, nil)
+	var btnPatchAll *widget.Button
+	var patchBnks []string // the listed banks, without the placeholder shown for an empty folder
 	
-	refreshBnks := func() {
-		files, _ := ioutil.ReadDir(bnkDir)
+	// os.ReadDir lists names without statting each bank, unlike ioutil.ReadDir.
+	listBnks := func() []string {
+		files, _ := os.ReadDir(bnkDir)
 		var names []string
 		for _, f := range files { if !f.IsDir() { names = append(names, f.Name()) } }
-		runOnUI(func() {
-			if len(names) == 0 {
-				names = append(names, "(No files found in BNK folder)")
-				bnkCheckGroup.Disable(); patchBnkSelect.Disable()
-			} else {
-				bnkCheckGroup.Enable(); patchBnkSelect.Enable()
-			}
-			bnkCheckGroup.Options = names; bnkCheckGroup.Refresh()
-			patchBnkSelect.Options = names; patchBnkSelect.Refresh()
-		})
+		return names
 	}
+	showBnks := func(names []string) {
+		patchBnks = names
+		if len(names) == 0 {
+			names = append(names, "(No files found in BNK folder)")
+			bnkCheckGroup.Disable(); patchBnkSelect.Disable()
+			if btnPatchAll != nil { btnPatchAll.Disable() }
+		} else {
+			bnkCheckGroup.Enable(); patchBnkSelect.Enable()
+			if btnPatchAll != nil { btnPatchAll.Enable() }
+		}
+		bnkCheckGroup.Options = names; bnkCheckGroup.Refresh()
+		patchBnkSelect.Options = names; patchBnkSelect.Refresh()
+	}
+	refreshBnks := func() { showBnks(listBnks()) }
 	
 	performExtraction := func(filesToExtract []string) {
 		workList := make([]string, len(filesToExtract))
 		copy(workList, filesToExtract)
+		decoderPath := cfg.Data.DecoderPath
 		go func() {
 			if len(workList) == 0 { logFunc("[ERROR] No files to extract.\n"); return }
-			decoderPath := cfg.Data.DecoderPath
 			if _, err := os.Stat(decoderPath); os.IsNotExist(err) { logFunc(fmt.Sprintf("[ERROR] vgmstream-cli.exe missing at %s\n", decoderPath)); return }
-			for _, filename := range workList {
-				bnkPath := filepath.Join(bnkDir, filename)
-				if !IsWwiseBank(bnkPath) { logFunc(fmt.Sprintf("[SKIP] %s is not valid.\n", filename)); continue }
-				bnkID := filename 
-				if strings.HasSuffix(filename, ".bnk") { bnkID = strings.TrimSuffix(filename, ".bnk") }
-				logFunc(fmt.Sprintf("Extracting: %s\n", filename))
-				data, didx, size, payload := parseBnk(bnkPath, logFunc)
-				if data == nil { continue }
-				wemDir := filepath.Join(audioFilesDir, bnkID); wavDir := filepath.Join(audioFilesDir, bnkID+"_WAV")
-				os.MkdirAll(wemDir, 0755); os.MkdirAll(wavDir, 0755)
-				num := int(size)/12
-				for i:=0; i<num; i++ {
-					pos := int(didx)+(i*12); fid := binary.LittleEndian.Uint32(data[pos:pos+4]); foff := binary.LittleEndian.Uint32(data[pos+4:pos+8]); fsize := binary.LittleEndian.Uint32(data[pos+8:pos+12])
-					wemPath := filepath.Join(wemDir, fmt.Sprintf("%d.wem", fid))
-					os.WriteFile(wemPath, data[int64(payload)+int64(foff) : int64(payload)+int64(foff)+int64(fsize)], 0644)
-					runDecoding(decoderPath, wemPath, filepath.Join(wavDir, fmt.Sprintf("%d.wav", fid)))
-				}
-				logFunc("Done.\n")
+			// Banks already overlap across workers; start the biggest first so a large one is not left running alone at the end.
+			sizes := make(map[string]int64, len(workList))
+			for _, f := range workList { if info, err := os.Stat(filepath.Join(bnkDir, f)); err == nil { sizes[f] = info.Size() } }
+			sort.SliceStable(workList, func(a, b int) bool { return sizes[workList[a]] > sizes[workList[b]] })
+			workers := runtime.NumCPU()
+			if workers > 8 { workers = 8 }
+			if workers > len(workList) { workers = len(workList) }
+			jobs := make(chan string)
+			var wg sync.WaitGroup
+			for w := 0; w < workers; w++ {
+				wg.Add(1)
+				go func() {
+					defer wg.Done()
+					for filename := range jobs {
+						bnkPath := filepath.Join(bnkDir, filename)
+						bnkID := strings.TrimSuffix(filename, ".bnk")
+						bankLog := newLineBuffer(logFunc)
+						bankLog.Log(fmt.Sprintf("Extracting: %s\n", filename))
+						if extractBank(bnkPath, filepath.Join(audioFilesDir, bnkID), filepath.Join(audioFilesDir, bnkID+"_WAV"), decoderPath, bankLog.Log) {
+							bankLog.Log(fmt.Sprintf("Done: %s\n", filename))
+						}
+						bankLog.Flush()
+					}
+				}()
 			}
+			for _, filename := range workList { jobs <- filename }
+			close(jobs)
+			wg.Wait()
+			trimCache(appCacheDir("wavcache"), cacheCap)
 			logFunc("Extraction Job Complete.\n")
 		}()
 	}
@@ -356,12 +1295,12 @@ func main() {
 		dialog.ShowFolderOpen(func(uri fyne.ListableURI, err error) {
 			if uri == nil { return }
 			path := uri.Path()
-			cfg.SetPath("wav_tools_dir", path)
-			files, err := ioutil.ReadDir(path)
+			cfg.SetPath("wav_tools_dir", path, true)
+			files, err := os.ReadDir(path)
 			if err != nil { logFunc(fmt.Sprintf("[ERROR] Reading dir: %v\n", err)); return }
 			count := 0
 			for _, f := range files {
-				if !f.IsDir() && strings.HasSuffix(strings.ToLower(f.Name()), ".wav") {
+				if !f.IsDir() && hasSuffixFold(f.Name(), ".wav") {
 					seqFiles = append(seqFiles, filepath.Join(path, f.Name()))
 					count++
 				}
@@ -371,14 +1310,31 @@ func main() {
 		}, myWindow)
 	})
 
-	btnRemSeq := widget.NewButton("-", func() { if len(seqFiles)>0 { seqFiles=seqFiles[:len(seqFiles)-1]; seqList.Refresh() } })
+	// Reordering swaps two entries and redraws only those two rows.
+	seqSel := -1
+	seqList.OnSelected = func(id widget.ListItemID) { seqSel = id }
+	// Removing drops the selection too, so Up/Down never act on a stale or out-of-range row.
+	btnRemSeq := widget.NewButton("-", func() { if len(seqFiles)>0 { seqFiles=seqFiles[:len(seqFiles)-1]; seqSel = -1; seqList.UnselectAll(); seqList.Refresh() } })
+	moveSeq := func(delta int) {
+		i, j := seqSel, seqSel+delta
+		if i < 0 || i >= len(seqFiles) || j < 0 || j >= len(seqFiles) { return }
+		seqFiles[i], seqFiles[j] = seqFiles[j], seqFiles[i]
+		seqList.RefreshItem(i); seqList.RefreshItem(j); seqList.Select(j)
+	}
+	btnUpSeq := widget.NewButtonWithIcon("", theme.MoveUpIcon(), func() { moveSeq(-1) })
+	btnDownSeq := widget.NewButtonWithIcon("", theme.MoveDownIcon(), func() { moveSeq(1) })
 	btnMerge := widget.NewButton("Merge", func() {
 		if len(seqFiles)<2 { return }
 		dialog.ShowFileSave(func(uri fyne.URIWriteCloser, err error) {
 			if uri!=nil {
 				path:=uri.URI().Path(); uri.Close()
+				files := append([]string(nil), seqFiles...)
 				go func() { 
-					f,_:=os.Create("list.txt"); for _,p:=range seqFiles { f.WriteString(fmt.Sprintf("file '%s'\n", p)) }; f.Close()
+					// Same-format PCM joins in place; anything else goes through ffmpeg's concat demuxer.
+					err := concatWavs(files, path)
+					if err == nil { logFunc("Merged.\n"); return }
+					logFunc(fmt.Sprintf("[WARN] Merging with ffmpeg: %v\n", err))
+					f,_:=os.Create("list.txt"); for _,p:=range files { f.WriteString(fmt.Sprintf("file '%s'\n", p)) }; f.Close()
 					runCommand("ffmpeg", "-y", "-f", "concat", "-safe", "0", "-i", "list.txt", "-c", "copy", path); os.Remove("list.txt"); logFunc("Merged.\n")
 				}()
 			}
@@ -386,23 +1342,70 @@ func main() {
 	})
 	entryBig := widget.NewEntry(); entryFade := widget.NewEntry(); entryFade.SetText("1.5"); chFade := widget.NewCheck("Fade", nil); chFade.Checked=true; chEnc := widget.NewCheck("Encode", nil); chEnc.Checked=true
 	btnSplit := widget.NewButton("Split & Encode", func() {
+		refs := append([]string(nil), seqFiles...); bigFile := entryBig.Text; fadeText := entryFade.Text
+		doFade := chFade.Checked; doEncode := chEnc.Checked; toolPath := cfg.Data.ToolPath; convertJobs := cfg.Data.ConvertJobs
+		// Bad input is reported in the log rather than a modal dialog, and before any work starts.
+		if len(refs) == 0 { logFunc("[ERROR] Add reference WAVs to the sequence first.\n"); return }
+		if bigFile == "" { logFunc("[ERROR] Choose a custom file to split.\n"); return }
 		go func() {
 			out := newWavDir // Save to NewWAVandWEMS
-			fade,_ := strconv.ParseFloat(entryFade.Text, 64); cur:=0.0
-			for _, ref := range seqFiles {
-				dur := getDuration(ref); wav := filepath.Join(out, filepath.Base(ref))
-				args := []string{"-y", "-i", entryBig.Text, "-ss", fmt.Sprintf("%f", cur), "-t", fmt.Sprintf("%f", dur)}
-				if chFade.Checked && dur > fade { args = append(args, "-af", fmt.Sprintf("afade=t=out:st=%f:d=%f", dur-fade, fade)) }
-				args = append(args, "-ac", "1", "-ar", "22050", wav); runCommand("ffmpeg", args...)
-				cur+=dur
-				if chEnc.Checked { runConversion(cfg.Data.ToolPath, wav, filepath.Join(out, strings.Replace(filepath.Base(ref),".wav",".wem",1)), "Vorbis Quality Low") }
+			fade,_ := strconv.ParseFloat(fadeText, 64)
+			// A clip's start only depends on the lengths before it, so lay them all out first and cut in parallel.
+			// Offsets are kept in whole sample frames so rounding never accumulates along the sequence.
+			type clip struct { wav string; start, frames int64 }
+			clips := make([]clip, len(refs)); cur := int64(0)
+			for i, ref := range refs { n := int64(math.Round(getDuration(ref) * splitRate)); clips[i] = clip{filepath.Join(out, filepath.Base(ref)), cur, n}; cur += n }
+			// Clips are sliced from 16-bit mono 22050 Hz PCM. Any other source is converted to that once up front,
+			// so ffmpeg decodes it a single time rather than once per clip.
+			srcPath := bigFile
+			src, err := readSplitSource(srcPath)
+			if err != nil {
+				tmp, terr := os.CreateTemp("", "echo-split-*.wav")
+				if terr != nil { logFunc(fmt.Sprintf("[ERROR] Split: %v\n", terr)); return }
+				srcPath = tmp.Name(); tmp.Close()
+				defer os.Remove(srcPath)
+				runCommand("ffmpeg", "-y", "-i", bigFile, "-ac", "1", "-ar", "22050", "-c:a", "pcm_s16le", srcPath)
+				if src, err = readSplitSource(srcPath); err != nil { logFunc(fmt.Sprintf("[ERROR] Split: could not convert %s\n", bigFile)); return }
+			}
+			srcFrames := src.DataSize / int64(src.BlockAlign)
+			var ramp []int32
+			if doFade { ramp = fadeRamp(int64(fade * splitRate)) }
+			jobs := make(chan int)
+			written := make([]bool, len(clips))
+			var wg sync.WaitGroup
+			for w := 0; w < min(runtime.NumCPU(), len(clips)); w++ {
+				wg.Add(1)
+				go func() {
+					defer wg.Done()
+					for i := range jobs {
+						c := clips[i]
+						// Clips that start past the end of the custom file are filled with silence.
+						if c.start >= srcFrames {
+							if !generateSilence(c.wav, float64(c.frames)/splitRate) { logFunc(fmt.Sprintf("[WARN] Could not write %s\n", c.wav)); continue }
+							written[i] = true
+							continue
+						}
+						if err := cutWav(srcPath, src, c.start, c.frames, c.wav); err != nil { logFunc(fmt.Sprintf("[WARN] Cut: %v\n", err)); continue }
+						written[i] = true
+						if doFade && float64(c.frames)/splitRate > fade { if err := fadeOutWav(c.wav, ramp); err != nil { logFunc(fmt.Sprintf("[WARN] Fade: %v\n", err)) } }
+					}
+				}()
+			}
+			for i := range clips { jobs <- i }
+			close(jobs)
+			wg.Wait()
+			if doEncode {
+				// Only clips that were written go to the converter; the rest already logged why.
+				var wavs []string
+				for i, c := range clips { if written[i] { wavs = append(wavs, c.wav) } }
+				convertAll(toolPath, wavs, out, "Vorbis Quality Low", convertJobs, logFunc)
 			}
 			logFunc(fmt.Sprintf("Split Complete. Files in %s\n", out))
 		}()
 	})
 	btnHelpSeq := widget.NewButtonWithIcon("", theme.QuestionIcon(), func() { showHelp("Help", "Sequencer Is Here to Rebuild A whole folder of wavs by splitting your custom wav and matching echo format") })
 	tabWav := container.NewTabItem("Sequencer", container.NewHSplit(
-		container.NewBorder(widget.NewLabel("Sequence"), container.NewHBox(btnAddSeq, btnAddFolder, btnRemSeq, layout.NewSpacer(), btnMerge), nil, nil, seqList),
+		container.NewBorder(widget.NewLabel("Sequence"), container.NewHBox(btnAddSeq, btnAddFolder, btnRemSeq, btnUpSeq, btnDownSeq, layout.NewSpacer(), btnMerge), nil, nil, seqList),
 		container.NewVBox(container.NewHBox(widget.NewLabel("Custom File"), layout.NewSpacer(), btnHelpSeq), widget.NewForm(widget.NewFormItem("Input", createBrowseRow(entryBig, false, []string{".wav"}, "wav_tools_dir")), widget.NewFormItem("Fade", entryFade)), container.NewHBox(chFade, chEnc), btnSplit),
 	))
 
@@ -410,45 +1413,50 @@ func main() {
 	entryWavC := widget.NewEntry(); entryOutC := widget.NewEntry(); entryOutC.SetText(cfg.Data.ConvertOutputDir); var wavsC []string
 	btnBrowseWC := widget.NewButtonWithIcon("", theme.FolderOpenIcon(), func() { fd:=dialog.NewFileOpen(func(r fyne.URIReadCloser, err error) { if r!=nil { wavsC=[]string{r.URI().Path()}; entryWavC.SetText("1 file") } }, myWindow); fd.SetFilter(storageFilter([]string{".wav"})); fd.Show() })
 	btnConv := widget.NewButton("Convert", func() {
+		wavs := append([]string(nil), wavsC...); outDir := entryOutC.Text; toolPath := cfg.Data.ToolPath; convertJobs := cfg.Data.ConvertJobs
+		if len(wavs) == 0 { logFunc("[ERROR] Choose a WAV to convert.\n"); return }
 		go func() {
-			os.MkdirAll(entryOutC.Text, 0755)
-			for _, w := range wavsC { runConversion(cfg.Data.ToolPath, w, filepath.Join(entryOutC.Text, strings.Replace(filepath.Base(w),".wav",".wem",1)), "Vorbis Quality High") }
-			logFunc("Convert Done.\n")
+			os.MkdirAll(outDir, 0755)
+			n := convertAll(toolPath, wavs, outDir, "Vorbis Quality High", convertJobs, logFunc)
+			logFunc(fmt.Sprintf("Convert Done (%d/%d).\n", n, len(wavs)))
 		}()
 	})
 	btnHelpConv := widget.NewButtonWithIcon("", theme.QuestionIcon(), func() { showHelp("Help", "Convert WAV to WEM using sound2wem.cmd, please note wwise launcher has to be installed") })
-	tabConvert := container.NewTabItem("Convert", container.NewVBox(container.NewHBox(layout.NewSpacer(), btnHelpConv), widget.NewForm(widget.NewFormItem("WAVs", container.NewBorder(nil,nil,nil,btnBrowseWC,entryWavC)), widget.NewFormItem("Out", createBrowseRow(entryOutC, true, nil, "convert_output_dir"))), btnConv))
+	jobOpts := []string{}
+	for i := 1; i <= runtime.NumCPU(); i++ { jobOpts = append(jobOpts, strconv.Itoa(i)) }
+	selJobs := widget.NewSelect(jobOpts, func(s string) { if n, err := strconv.Atoi(s); err == nil { cfg.SetConvertJobs(n) } })
+	// Set directly: SetSelected would fire the callback and rewrite the config on every launch.
+	selJobs.Selected = strconv.Itoa(min(cfg.Data.ConvertJobs, runtime.NumCPU()))
+	// Scripts are batched one run at a time, so the job count only applies to other converters.
+	syncJobs := func() { if isScript(cfg.Data.ToolPath) { selJobs.Disable() } else { selJobs.Enable() } }
+	syncJobs()
+	tabConvert := container.NewTabItem("Convert", container.NewVBox(container.NewHBox(layout.NewSpacer(), btnHelpConv), widget.NewForm(widget.NewFormItem("WAVs", container.NewBorder(nil,nil,nil,btnBrowseWC,entryWavC)), widget.NewFormItem("Out", createBrowseRow(entryOutC, true, nil, "convert_output_dir"))), container.NewBorder(nil,nil,nil,container.NewHBox(widget.NewLabel("Jobs"), selJobs),btnConv)))
 
 	// 4. PATCH
 	entryWemDirP := widget.NewEntry(); entryWemDirP.SetText(cfg.Data.PatchWemDir); entryOutP := widget.NewEntry(); entryOutP.SetText(cfg.Data.PatchOutputDir)
-	btnPatch := widget.NewButton("Rebuild", func() {
+	performPatch := func(bnkNames []string) {
+		wemDir := entryWemDirP.Text; out := entryOutP.Text
 		go func() {
-			if patchBnkSelect.Selected == "" { logFunc("Select a bank.\n"); return }
-			out := entryOutP.Text; os.MkdirAll(out, 0755); avail := make(map[string]string)
-			files, _ := ioutil.ReadDir(entryWemDirP.Text)
-			for _, f := range files { if strings.HasSuffix(strings.ToLower(f.Name()), ".wem") { avail[strings.TrimSuffix(f.Name(), filepath.Ext(f.Name()))] = filepath.Join(entryWemDirP.Text, f.Name()) } }
-			bnkName := patchBnkSelect.Selected; bnkPath := filepath.Join(bnkDir, bnkName)
-			logFunc(fmt.Sprintf("Patching %s\n", bnkName))
-			data, didx, size, payload := parseBnk(bnkPath, logFunc)
-			if data != nil {
-				num := int(size)/12
-				for i:=0; i<num; i++ {
-					pos := int(didx)+(i*12); fid := binary.LittleEndian.Uint32(data[pos:pos+4]); foff := binary.LittleEndian.Uint32(data[pos+4:pos+8]); max := binary.LittleEndian.Uint32(data[pos+8:pos+12])
-					if wem, ok := avail[fmt.Sprintf("%d", fid)]; ok {
-						nb, _ := os.ReadFile(wem)
-						if len(nb) <= int(max) {
-							abs := int64(payload)+int64(foff); copy(data[abs:], nb)
-							if pad := int(max)-len(nb); pad > 0 { copy(data[abs+int64(len(nb)):], make([]byte, pad)) }
-							binary.LittleEndian.PutUint32(data[pos+8:], uint32(len(nb))); logFunc(fmt.Sprintf("[OK] %d\n", fid))
-						} else { logFunc(fmt.Sprintf("[FAIL] %d too big\n", fid)) }
-					}
-				}
-				os.WriteFile(filepath.Join(out, bnkName), data, 0644); logFunc("Saved.\n")
-			}
+			if len(bnkNames) == 0 { logFunc("Select a bank.\n"); return }
+			if err := os.MkdirAll(out, 0755); err != nil { logFunc(fmt.Sprintf("[ERROR] %v\n", err)); return }
+			avail := scanWems(wemDir)
+			bnkPaths := make([]string, len(bnkNames))
+			for i, name := range bnkNames { bnkPaths[i] = filepath.Join(bnkDir, name) }
+			logFunc(fmt.Sprintf("Patching %d bank(s) from %d WEMs\n", len(bnkPaths), len(avail)))
+			patchLog := newLineBuffer(logFunc)
+			saved := patchBanks(bnkPaths, out, avail, patchLog.Log)
+			patchLog.Flush()
+			logFunc(fmt.Sprintf("Patch Job Complete: %d saved.\n", saved))
 		}()
+	}
+	btnPatch := widget.NewButton("Rebuild", func() {
+		if patchBnkSelect.Selected == "" { performPatch(nil); return }
+		performPatch([]string{patchBnkSelect.Selected})
 	})
+	btnPatchAll = widget.NewButton("Rebuild All", func() { performPatch(patchBnks) })
+	if len(patchBnks) == 0 { btnPatchAll.Disable() }
 	btnHelpPatch := widget.NewButtonWithIcon("", theme.QuestionIcon(), func() { showHelp("Help", "Patch new WEMs into BNK") })
-	tabPatch := container.NewTabItem("Patch", container.NewVBox(container.NewHBox(layout.NewSpacer(), btnHelpPatch), widget.NewForm(widget.NewFormItem("Bank", patchBnkSelect), widget.NewFormItem("WEMs", createBrowseRow(entryWemDirP, true, nil, "patch_wem_dir")), widget.NewFormItem("Out", createBrowseRow(entryOutP, true, nil, "patch_output_dir"))), btnPatch))
+	tabPatch := container.NewTabItem("Patch", container.NewVBox(container.NewHBox(layout.NewSpacer(), btnHelpPatch), widget.NewForm(widget.NewFormItem("Bank", patchBnkSelect), widget.NewFormItem("WEMs", createBrowseRow(entryWemDirP, true, nil, "patch_wem_dir")), widget.NewFormItem("Out", createBrowseRow(entryOutP, true, nil, "patch_output_dir"))), container.NewGridWithColumns(2, btnPatch, btnPatchAll)))
 
 	
 	entryToolSettings := widget.NewEntry(); entryToolSettings.SetText(cfg.Data.ToolPath)
@@ -467,10 +1475,8 @@ func main() {
 		if chkSeq.Checked { activeTabs = append(activeTabs, tabWav) }
 		if chkConv.Checked { activeTabs = append(activeTabs, tabConvert) }
 		if chkPatch.Checked { activeTabs = append(activeTabs, tabPatch) }
-		runOnUI(func() {
-			tabs.SetItems(activeTabs)
-			if len(activeTabs) > 0 { tabs.SelectIndex(0) }
-		})
+		tabs.SetItems(activeTabs)
+		if len(activeTabs) > 0 { tabs.SelectIndex(0) }
 	}
 
 	openSettings := func() {
@@ -481,13 +1487,15 @@ func main() {
 			widget.NewFormItem("vgmstream", createBrowseRow(entryVgmSettings, false, []string{".exe"}, "decoder_path")),
 		)
 		saveBtn := widget.NewButtonWithIcon("Save & Close", theme.DocumentSaveIcon(), func() {
-			cfg.Data.ToolPath = entryToolSettings.Text
-			cfg.Data.DecoderPath = entryVgmSettings.Text
-			cfg.Data.ShowExtract = chkExtract.Checked
-			cfg.Data.ShowSequencer = chkSeq.Checked
-			cfg.Data.ShowConvert = chkConv.Checked
-			cfg.Data.ShowPatch = chkPatch.Checked
-			cfg.Save()
+			cfg.Update(func(d *Config) {
+				d.ToolPath = entryToolSettings.Text
+				d.DecoderPath = entryVgmSettings.Text
+				d.ShowExtract = chkExtract.Checked
+				d.ShowSequencer = chkSeq.Checked
+				d.ShowConvert = chkConv.Checked
+				d.ShowPatch = chkPatch.Checked
+			})
+			syncJobs()
 			updateTabs()
 			w.Close()
 		})
@@ -497,7 +1505,8 @@ func main() {
 
 	btnSettings := widget.NewButtonWithIcon("", theme.SettingsIcon(), openSettings)
 
-	refreshBnks()
+	// The bank folder is listed in the background so the window opens without waiting on it.
+	go func() { names := listBnks(); fyne.Do(func() { showBnks(names) }) }()
 	updateTabs()
 	
 	// Layout
@@ -508,6 +1517,7 @@ func main() {
 
 	myWindow.SetContent(mainSplit)
 	myWindow.ShowAndRun()
+	cfg.Flush()
 }
 
 func storageFilter(exts []string) storage.FileFilter { return storage.NewExtensionFileFilter(exts) }
\ No newline at end of file